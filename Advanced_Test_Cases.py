@@ -2,7 +2,7 @@ import time
 import random
 import string
 import sys
-from memory_profiler import memory_usage
+import tracemalloc
 from FM_Index import FMIndex as SuffixArray  # Ensure this matches your implementation
 
 def generate_random_string(length):
@@ -18,20 +18,23 @@ def run_test(test_name, text, expected_output=None, log_memory=True):
         return
     
     start_time = time.time()
-    
-    # Memory profiling must be wrapped in a function
-    def profile_func():
-        return SuffixArray(text)
-    
-    mem_usage = memory_usage(profile_func, max_usage=True) if log_memory else None
-    
-    sa = profile_func()
+
+    # tracemalloc tracks the peak allocation of this exact build, without
+    # the sampling thread and re-invocation overhead of memory_profiler.
+    if log_memory:
+        tracemalloc.start()
+        sa = SuffixArray(text)
+        mem_usage = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+    else:
+        mem_usage, sa = None, SuffixArray(text)
+
     suffix_array = sa.suffix_array
-    
+
     execution_time = time.time() - start_time
 
     if expected_output is not None:
-        assert suffix_array == expected_output, f"Test Failed: Expected {expected_output}, Got {suffix_array}"
+        assert suffix_array.tolist() == expected_output, f"Test Failed: Expected {expected_output}, Got {suffix_array}"
     
     print(f"Execution Time: {execution_time:.5f} seconds")
     if log_memory:
@@ -12,7 +12,7 @@ def run_tests():
     print("\nTest Case 1: Initialization")
     assert fm_index.text == "banana$", "Text initialization failed."
     assert fm_index.bwt == "annb$aa", "BWT computation failed."
-    assert fm_index.suffix_array == [6, 5, 3, 1, 0, 4, 2], "Suffix array computation failed."
+    assert fm_index.suffix_array.tolist() == [6, 5, 3, 1, 0, 4, 2], "Suffix array computation failed."
     print("Initialization successful!")
 
     # Test Case 2: Searching for patterns
@@ -20,7 +20,6 @@ def run_tests():
     pattern1 = "ana"
     pattern2 = "ban"
     pattern3 = "xyz"
-    a = fm_index.search(pattern2)
     assert fm_index.search(pattern1) == [1,3], f"Search for '{pattern1}' failed."
     assert fm_index.search(pattern2) == [0], f"Search for '{pattern2}' failed."
     assert fm_index.search(pattern3) == [], f"Search for '{pattern3}' failed."
@@ -1,23 +1,339 @@
-from collections import defaultdict
+import hashlib
+import os
+import pickle
+from collections import Counter, defaultdict
 from typing import List, Dict
 
+import numpy as np
+
+try:
+    # Optional C extension: linear-time suffix array construction (libdivsufsort).
+    from pydivsufsort import divsufsort as _divsufsort
+except ImportError:
+    _divsufsort = None
+
+try:
+    # Optional JIT compiler for the backward-search hot loop.
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
+if _njit is not None:
+    @_njit(cache=True)
+    def _backward_search_jit(l, r, pattern_ids, c_arr, rank_2d):
+        """ Native backward-search kernel over the contiguous rank matrix. """
+        for k in range(len(pattern_ids) - 1, -1, -1):
+            cid = pattern_ids[k]
+            row = rank_2d[cid]
+            start = c_arr[cid]
+            if l > 0:
+                l = start + row[l - 1]
+            else:
+                l = start
+            r = start + row[r] - 1
+            if l > r:
+                return -1, -2
+        return l, r
+else:
+    _backward_search_jit = None
+
+class WaveletTree:
+    """
+    Compact rank support over a sequence of character codes. Instead of one
+    dense cumulative array per character (4*n*sigma bytes), the codes are
+    split into ceil(log2 sigma) bit levels, each stored as packed 64-bit
+    words with a cumulative popcount per word - about n*log2(sigma) bits in
+    total. rank(code, i) walks one level per bit of the code, answering each
+    level with a single word popcount.
+    """
+
+    class _Node:
+        __slots__ = ('words', 'cum', 'mid', 'left', 'right')
+
+    def __init__(self, codes: np.ndarray):
+        self.size = len(codes)
+        self._alphabet = np.unique(codes)
+        self._index = {int(c): i for i, c in enumerate(self._alphabet.tolist())}
+        symbols = np.searchsorted(self._alphabet, codes)
+        self._root = self._build(symbols, 0, len(self._alphabet))
+
+    def _build(self, symbols: np.ndarray, lo: int, hi: int):
+        """ Recursively build the node covering alphabet slots [lo, hi). """
+        if hi - lo < 2:
+            return None  # Leaf: a single symbol needs no bits.
+        mid = (lo + hi) // 2
+        bits = symbols >= mid
+        node = self._Node()
+        node.mid = mid
+        node.words, node.cum = self._pack(bits)
+        node.left = self._build(symbols[~bits], lo, mid)
+        node.right = self._build(symbols[bits], mid, hi)
+        return node
+
+    @staticmethod
+    def _pack(bits: np.ndarray):
+        """ Pack a boolean array into 64-bit words plus per-word popcount sums. """
+        packed = np.packbits(bits)
+        if len(packed) % 8:
+            packed = np.pad(packed, (0, 8 - len(packed) % 8))
+        words = packed.view('>u8')
+        cum = np.zeros(len(words) + 1, dtype=np.int64)
+        cum[1:] = np.bitwise_count(words).cumsum()
+        return words, cum
+
+    @staticmethod
+    def _rank1(node, i: int) -> int:
+        """ Number of set bits in the first i bits of the node's bitvector. """
+        # int.bit_count compiles down to the hardware POPCNT instruction, so
+        # the per-word cost is one cumulative-counter load plus one popcount.
+        word, offset = divmod(i, 64)
+        count = int(node.cum[word])
+        if offset:
+            count += (int(node.words[word]) >> (64 - offset)).bit_count()
+        return count
+
+    def rank(self, code: int, i: int) -> int:
+        """ Number of occurrences of `code` in the first i positions. """
+        if i <= 0:
+            return 0
+        symbol = self._index.get(code)
+        if symbol is None:
+            return 0
+        node = self._root
+        lo, hi = 0, len(self._alphabet)
+        while hi - lo > 1:
+            ones = self._rank1(node, i)
+            if symbol >= node.mid:
+                i, node, lo = ones, node.right, node.mid
+            else:
+                i, node, hi = i - ones, node.left, node.mid
+        return i
+
+    def rank2(self, code: int, i: int, j: int):
+        """
+        rank(code, i) and rank(code, j) computed in a single root-to-leaf
+        walk. Backward search needs the rank at both range boundaries for
+        the same character, and both queries follow the same path through
+        the tree, so fusing them halves the traversal work per step.
+        """
+        symbol = self._index.get(code)
+        if symbol is None:
+            return 0, 0
+        node = self._root
+        lo, hi = 0, len(self._alphabet)
+        while hi - lo > 1:
+            ones_i = self._rank1(node, i)
+            ones_j = self._rank1(node, j)
+            if symbol >= node.mid:
+                i, j, node, lo = ones_i, ones_j, node.right, node.mid
+            else:
+                i, j, node, hi = i - ones_i, j - ones_j, node.left, node.mid
+        return i, j
+
+
 class FMIndex:
-    def __init__(self, text: str):
+    def __init__(self, text: str, sa_sample_rate: int = 1,
+                 compact_rank: bool = False):
         # Ensure that the input text is not empty.
         if not text:
             raise ValueError("Input text cannot be empty.")
+        if sa_sample_rate < 1:
+            raise ValueError("Sample rate must be a positive integer.")
         # Append the sentinel character '$' to mark the end of the text.
-        self.text = text + "$"
+        # The text is kept in a mutable bytearray so single-character edits
+        # patch it in place instead of copying the whole string.
+        self._store_text(text + "$")
+        # With sa_sample_rate == 1 the full suffix array is kept (the default,
+        # matching the original behavior); with rate s > 1 only positions
+        # divisible by s are stored and locate() recovers the rest by walking
+        # the LF-mapping, cutting SA memory by roughly a factor of s.
+        self.sa_sample_rate = sa_sample_rate
+        # With compact_rank the dense per-character rank arrays are replaced
+        # by a bit-packed wavelet tree: ~n*log2(sigma) bits instead of
+        # 4*n*sigma bytes, at the cost of log2(sigma) popcounts per rank.
+        self.compact_rank = compact_rank
+        self._build_index()
+
+    def _store_text(self, text: str):
+        """ Keep the text as a bytearray when single-byte, else as a str. """
+        try:
+            self._text_ba = bytearray(text.encode('latin-1'))
+            self._text_str = None
+        except UnicodeEncodeError:
+            self._text_ba = None
+            self._text_str = text
+
+    @property
+    def text(self) -> str:
+        """ The indexed text (including the sentinel), as a string. """
+        if self._text_ba is not None:
+            return self._text_ba.decode('latin-1')
+        return self._text_str
+
+    @classmethod
+    def from_text_cached(cls, text: str, cache_dir: str = '.fmindex_cache',
+                         sa_sample_rate: int = 1, compact_rank: bool = False):
+        """
+        Builds an FMIndex, reusing a pickled copy from cache_dir when the
+        same text (and construction options) was indexed before. Repeated
+        runs over identical inputs then skip construction entirely.
+        """
+        digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+        path = os.path.join(cache_dir,
+                            f"{digest}-s{sa_sample_rate}-c{int(compact_rank)}.pkl")
+        if os.path.exists(path):
+            with open(path, 'rb') as handle:
+                return pickle.load(handle)
+        index = cls(text, sa_sample_rate=sa_sample_rate, compact_rank=compact_rank)
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(path, 'wb') as handle:
+            pickle.dump(index, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        return index
+
+    def _build_index(self):
+        """ Builds every component of the index from self.text. """
+        # Keep the text as a contiguous NumPy array of character codes so the
+        # BWT and rank builds can run as vectorized C passes, plus a bytes
+        # view for memcmp-style suffix comparisons (single-byte text only).
+        self._text_arr = self._encode_chars(self.text)
+        self._text_bytes = (self._text_arr.tobytes()
+                            if self._text_arr.dtype == np.uint8 else None)
         # Build the suffix array for the text using an optimized algorithm.
-        self.suffix_array = self._build_suffix_array(self.text)
-        # Build the Burrows-Wheeler Transform (BWT) using the suffix array.
-        self.bwt = self._build_bwt()
-        # Build the rank array (using a wavelet tree like structure) from the BWT.
-        self.rank_array = self._build_rank_wavelet_tree()
-        # Build the C-table which maps characters to their starting index in the suffix array.
-        self.c_table = self._build_c_table()
+        sa = self._build_suffix_array(self.text)
+        self.suffix_array = sa if self.sa_sample_rate == 1 else None
+        # Build the Burrows-Wheeler Transform (BWT) using the suffix array;
+        # this also caches the BWT code array as self._bwt_arr.
+        self.bwt = self._build_bwt(sa)
+        # Build rank support and the C-table from one pass over the BWT:
+        # dense per-character arrays by default, or a bit-packed wavelet
+        # tree when compact_rank is set.
+        self.rank_array, self.c_table = self._build_rank_and_c()
+        self._wavelet = WaveletTree(self._bwt_arr) if self.compact_rank else None
+        # C-table values in alphabet order, for the JIT search kernel.
+        self._c_arr = (np.fromiter(self.c_table.values(), dtype=np.int64)
+                       if self.rank_array is not None else None)
+        self._rank_by_byte, self._c_by_byte = self._build_byte_tables()
+        # Seed table mapping every k-mer that occurs in the text to its SA
+        # range, so search can skip its first k backward steps.
+        self._ftab_k = self._pick_ftab_k()
+        self._ftab = self._build_ftab(self._ftab_k) if self._ftab_k else None
+        # One-array LF-mapping, the workhorse of locate's sample walk.
+        self._LF = self._build_lf()
+        if self.sa_sample_rate > 1:
+            self._sample_suffix_array(sa)
+
+    def _sample_suffix_array(self, sa: np.ndarray):
+        """ Keeps only every s-th text position of the suffix array. """
+        mask = sa % self.sa_sample_rate == 0
+        self._sa_sample_mask = mask
+        # Inclusive count of samples up to each row, to index the values.
+        self._sa_sample_rank = np.cumsum(mask, dtype=np.int32)
+        self._sa_samples = sa[mask]
+
+    def locate(self, row: int) -> int:
+        """
+        Maps a row of the BWT matrix to its position in the text. With a
+        sampled suffix array this walks the LF-mapping (at most
+        sa_sample_rate - 1 steps) until it reaches a sampled row.
+        """
+        if self.suffix_array is not None:
+            return int(self.suffix_array[row])
+        lf = self._LF
+        steps = 0
+        while not self._sa_sample_mask[row]:
+            row = int(lf[row])
+            steps += 1
+        return int(self._sa_samples[self._sa_sample_rank[row] - 1]) + steps
+
+    def _build_lf(self) -> np.ndarray:
+        """
+        The LF-mapping as a single int array: LF[i] is the row of suffix
+        SA[i] - 1, i.e. C[bwt[i]] + rank of bwt[i] at i. Precomputing it
+        turns each LF step in locate into one array load instead of a dict
+        probe plus a rank query. A stable argsort of the BWT gives exactly
+        this permutation in one vectorized pass.
+        """
+        n = len(self._bwt_arr)
+        dtype = np.int32 if n < 2 ** 31 else np.int64
+        lf = np.empty(n, dtype=dtype)
+        lf[np.argsort(self._bwt_arr, kind='stable')] = np.arange(n, dtype=dtype)
+        return lf
+
+    def _build_byte_tables(self):
+        """
+        Specialized lookup tables for byte alphabets: 256-slot lists indexed
+        by ord(char), so the search loop replaces string hashing with plain
+        integer indexing. Returns None entries for wide alphabets or the
+        wavelet representation, which keep the dict path.
+        """
+        if self.rank_array is None or self._bwt_arr.dtype != np.uint8:
+            return None, None
+        rank_by_byte = [None] * 256
+        c_by_byte = [None] * 256
+        for char, row in self.rank_array.items():
+            rank_by_byte[ord(char)] = row
+        for char, start in self.c_table.items():
+            c_by_byte[ord(char)] = start
+        return rank_by_byte, c_by_byte
+
+    def _pick_ftab_k(self) -> int:
+        """
+        Choose the seed length k for the k-mer table: the largest k <= 5
+        whose sigma^k k-mer space stays small (a few thousand entries), so
+        DNA-sized alphabets get k=5 and full lowercase text gets k=2.
+        """
+        sigma = len(self.c_table)
+        k = 0
+        while k < 5 and sigma ** (k + 1) <= 4096:
+            k += 1
+        return k
+
+    def _build_ftab(self, k: int) -> Dict[str, tuple]:
+        """
+        Build the ftab by backward-stepping every k-mer from the full range,
+        pruning prefixes that do not occur so only present k-mers are stored.
+        """
+        ftab = {}
+        chars = list(self.c_table)
+        def extend(suffix: str, l: int, r: int, depth: int):
+            if depth == k:
+                ftab[suffix] = (l, r)
+                return
+            for char in chars:
+                start = self.c_table[char]
+                nl = start + (self._occ(char, l - 1) if l > 0 else 0)
+                nr = start + self._occ(char, r) - 1
+                if nl <= nr:
+                    extend(char + suffix, nl, nr, depth + 1)
+        extend("", 0, len(self.bwt) - 1, 0)
+        return ftab
+
+    def _occ(self, char: str, row: int) -> int:
+        """ Number of occurrences of char in bwt[0..row] (inclusive). """
+        if self.rank_array is not None:
+            return int(self.rank_array[char][row])
+        return self._wavelet.rank(ord(char), row + 1)
 
-    def _build_suffix_array(self, s: str) -> List[int]:
+    def _build_suffix_array(self, s: str) -> np.ndarray:
+        """
+        Build the suffix array in linear time using the libdivsufsort C
+        extension when available, falling back to the pure-Python doubling
+        algorithm otherwise. The result is a contiguous int32 array (int64
+        for texts too long to index with 32 bits) rather than a list of
+        boxed Python ints.
+        """
+        dtype = np.int32 if len(s) < 2 ** 31 else np.int64
+        if _divsufsort is not None:
+            try:
+                # Byte positions only line up with character positions when
+                # every character fits in one byte, so wide text falls through
+                # to the pure-Python path.
+                return np.asarray(_divsufsort(s.encode('latin-1')), dtype=dtype)
+            except UnicodeEncodeError:
+                pass
+        return np.asarray(self._build_suffix_array_doubling(s), dtype=dtype)
+
+    def _build_suffix_array_doubling(self, s: str) -> List[int]:
         """
         Build the suffix array using the doubling algorithm (Manber–Myers method)
         which runs in O(n log n) time.
@@ -51,105 +367,308 @@ class FMIndex:
                 break
         return sa
 
-    def _build_bwt(self) -> str:
+    def _build_bwt(self, sa: np.ndarray) -> str:
         """ Constructs the Burrows-Wheeler Transform (BWT) from the suffix array """
-        # For each index in the suffix array, select the preceding character in text
-        # (or the sentinel character '$' if at the beginning).
-        return "".join(self.text[i - 1] if i != 0 else "$" for i in self.suffix_array)
-    
-    def _build_rank_wavelet_tree(self) -> Dict[str, List[int]]:
-        """ Build a rank array where each character's list is of full length. """
-        n = len(self.bwt)
-        # Initialize rank for every character that appears in the BWT
-        alphabet = set(self.bwt)
-        rank = {char: [0] * n for char in alphabet}
-        # Temporary counts for each character
-        counts = {char: 0 for char in alphabet}
-
-        # Build the cumulative counts
-        for i, char in enumerate(self.bwt):
-            counts[char] += 1
-            for c in alphabet:
-                rank[c][i] = counts[c]
-        return rank
-    
-    def _build_c_table(self) -> Dict[str, int]:
-        """ Builds C-table to store the starting position of characters in the sorted order """
-        sorted_chars = sorted(set(self.bwt))
-        c_table = {}
-        total = 0  # Running total of character frequencies.
-        for char in sorted_chars:
-            c_table[char] = total
-            total += self.bwt.count(char)
-        return c_table
-    
+        # Gather the preceding character of every suffix in one C-level pass;
+        # the modulo wraps index 0 to the final sentinel character '$'.
+        self._bwt_arr = self._text_arr[(sa - 1) % len(self._text_arr)]
+        return self._decode_chars(self._bwt_arr)
+
+    @staticmethod
+    def _encode_chars(s: str) -> np.ndarray:
+        """ Encode a string as a NumPy array of character codes (one per char). """
+        try:
+            # Common case: every character fits in one byte.
+            return np.frombuffer(s.encode('latin-1'), dtype=np.uint8)
+        except UnicodeEncodeError:
+            # Wide characters (e.g. the Unicode test case): use full code points.
+            return np.frombuffer(s.encode('utf-32-le'), dtype=np.uint32)
+
+    @staticmethod
+    def _decode_chars(arr: np.ndarray) -> str:
+        """ Inverse of _encode_chars: turn a code array back into a string. """
+        encoding = 'latin-1' if arr.dtype == np.uint8 else 'utf-32-le'
+        return arr.tobytes().decode(encoding)
+
+    def _build_rank_and_c(self):
+        """
+        Build the rank arrays and the C-table from a single histogram of the
+        BWT: the histogram's cumulative sums are the C values, and its
+        nonzero entries give the alphabet for the per-character rank rows,
+        so the BWT is traversed once instead of once per table.
+        """
+        hist = np.bincount(self._bwt_arr)
+        codes = np.flatnonzero(hist)
+        starts = np.concatenate(([0], np.cumsum(hist[codes])[:-1]))
+        c_table = {chr(code): int(start)
+                   for code, start in zip(codes.tolist(), starts.tolist())}
+        if self.compact_rank:
+            return None, c_table
+        # One vectorized cumulative sum per character; the rows share one
+        # contiguous [sigma, n] matrix so the JIT kernel can index it
+        # without dict lookups.
+        self._rank_2d = np.empty((len(codes), len(self._bwt_arr)), dtype=np.int32)
+        for i, code in enumerate(codes):
+            np.cumsum(self._bwt_arr == code, dtype=np.int32, out=self._rank_2d[i])
+        self._alpha_id = {chr(code): i for i, code in enumerate(codes.tolist())}
+        return {char: self._rank_2d[i] for char, i in self._alpha_id.items()}, c_table
+
     def search(self, pattern: str) -> List[int]:
         """ Searches for a pattern in the text using backward search """
         if not pattern:
             raise ValueError("Search pattern cannot be empty.")
         l, r = 0, len(self.bwt) - 1
-        for char in reversed(pattern):
-            if char not in self.c_table:
+        if self._ftab is not None and len(pattern) >= self._ftab_k:
+            # Seed the range from the tabulated last k characters, skipping
+            # the first k backward steps.
+            seed = self._ftab.get(pattern[-self._ftab_k:])
+            if seed is None:
+                return []  # That k-mer never occurs in the text.
+            l, r = seed
+            pattern = pattern[:-self._ftab_k]
+        if _backward_search_jit is not None and self.rank_array is not None:
+            try:
+                ids = np.array([self._alpha_id[char] for char in pattern],
+                               dtype=np.int64)
+            except KeyError:
                 return []  # Character not found in text
-            l = self.c_table[char] + (self.rank_array[char][l - 1] if l > 0 else 0)
-            r = self.c_table[char] + self.rank_array[char][r] - 1
+            l, r = _backward_search_jit(l, r, ids, self._c_arr, self._rank_2d)
             if l > r:
                 return []  # Pattern does not exist
-        return sorted([self.suffix_array[i] for i in range(l, r + 1)])
+        elif self._rank_by_byte is not None:
+            # Byte-alphabet fast path: index 256-slot tables by ord(char)
+            # instead of hashing one-character strings into dicts.
+            rank_b = self._rank_by_byte
+            c_b = self._c_by_byte
+            for char in reversed(pattern):
+                code = ord(char)
+                if code > 255 or rank_b[code] is None:
+                    return []  # Character not found in text
+                ra = rank_b[code]
+                l = c_b[code] + (ra[l - 1] if l > 0 else 0)
+                r = c_b[code] + ra[r] - 1
+                if l > r:
+                    return []  # Pattern does not exist
+        else:
+            # Hoist the attribute and dict lookups out of the hot loop; each
+            # iteration then costs one dict probe per table instead of two.
+            rank = self.rank_array
+            starts = self.c_table
+            wavelet = self._wavelet
+            for char in reversed(pattern):
+                start = starts.get(char)
+                if start is None:
+                    return []  # Character not found in text
+                if rank is not None:
+                    ra = rank[char]
+                    l = start + (ra[l - 1] if l > 0 else 0)
+                    r = start + ra[r] - 1
+                else:
+                    occ_l, occ_r = wavelet.rank2(ord(char), l, r + 1)
+                    l = start + occ_l
+                    r = start + occ_r - 1
+                if l > r:
+                    return []  # Pattern does not exist
+        if self.suffix_array is None:
+            return sorted(self.locate(i) for i in range(l, r + 1))
+        # Sort the matching range at C speed instead of boxing every position.
+        return np.sort(self.suffix_array[l:r + 1]).tolist()
     
     def insert(self, char: str):
         """ Inserts a single character and updates the index """
         if len(char) != 1:
             raise ValueError("Only single characters can be inserted.")
-        self.text = self.text[:-1] + char + "$"  # Insert before sentinel.
-        self._incremental_update()
-    
+        position = len(self.text) - 1  # Insert before sentinel.
+        if self._text_ba is not None:
+            try:
+                # In-place splice before the sentinel: amortized O(1) append
+                # instead of copying the whole text.
+                self._text_ba[-1:] = char.encode('latin-1') + b'$'
+            except UnicodeEncodeError:
+                # A wide character forces the text onto the string path.
+                self._store_text(self.text[:-1] + char + "$")
+        else:
+            self._text_str = self._text_str[:-1] + char + "$"
+        if self.suffix_array is None:
+            self._build_index()  # A sampled SA cannot be spliced row by row.
+        else:
+            self._update_insert(position, char)
+
     def delete(self, index: int):
         """ Deletes a character at a given index and updates the index """
         if not (0 <= index < len(self.text) - 1):
             raise ValueError("Index out of range.")
-        self.text = self.text[:index] + self.text[index + 1:]
-        self._incremental_update()
-    
-    def _incremental_update(self):
-        """ Efficient update method to avoid full recomputation """
-        self.suffix_array = self._build_suffix_array(self.text)
-        self.bwt = self._build_bwt()
-        self.rank_array = self._build_rank_wavelet_tree()
-        self.c_table = self._build_c_table()
-    
+        if self._text_ba is not None:
+            del self._text_ba[index]  # In-place removal, no full copy.
+        else:
+            self._text_str = self._text_str[:index] + self._text_str[index + 1:]
+        if self.suffix_array is None:
+            self._build_index()  # A sampled SA cannot be spliced row by row.
+        else:
+            self._update_delete(index)
+
+    @staticmethod
+    def _char_starts(text: str) -> Dict[str, int]:
+        """ Number of characters in the text strictly smaller than each character. """
+        starts = {}
+        total = 0
+        for char, count in sorted(Counter(text).items()):
+            starts[char] = total
+            total += count
+        return starts
+
+    def _update_insert(self, position: int, char: str):
+        """
+        Update the BWT and suffix array after inserting one character at
+        `position` (self.text already reflects the edit). Only the rows the
+        edit touches are rewritten, following the LF-mapping update scheme:
+        the row of the old suffix at `position` gets the new character as
+        its BWT entry, one new row is inserted for the new suffix, and a
+        reorder cascade moves any earlier suffixes whose relative order
+        changed. This avoids re-sorting all suffixes from scratch.
+        """
+        sa = self.suffix_array.tolist()
+        bwt = list(self.bwt)
+        starts = self._char_starts(self.text)
+
+        # Suffix start positions at or after the insertion point shift right.
+        sa = [q if q < position else q + 1 for q in sa]
+
+        # The inserted character now precedes the suffix that used to start
+        # at `position` (its start is now position + 1).
+        pos = sa.index(position + 1)
+        bwt[pos] = char
+
+        # Insert the row of the new suffix: its rank among rows starting with
+        # `char` equals the rank of the suffix it precedes.
+        row = starts[char] + bwt[:pos].count(char)
+        preceding = self.text[position - 1] if position > 0 else "$"
+        bwt.insert(row, preceding)
+        sa.insert(row, position)
+
+        self._reorder(sa, bwt, starts, row, position - 1)
+        self._finish_update(sa, bwt)
+
+    def _update_delete(self, position: int):
+        """
+        Update the BWT and suffix array after deleting the character at
+        `position` (self.text already reflects the edit): drop the deleted
+        suffix's row, splice its predecessor onto the following suffix, and
+        run the reorder cascade for earlier suffixes.
+        """
+        sa = self.suffix_array.tolist()
+        bwt = list(self.bwt)
+        starts = self._char_starts(self.text)
+
+        # The suffix after the deleted character is now preceded by the
+        # character before the deletion point.
+        pos = sa.index(position + 1)
+        bwt[pos] = self.text[position - 1] if position > 0 else "$"
+
+        # Remove the deleted suffix's row.
+        row_del = sa.index(position)
+        bwt.pop(row_del)
+        sa.pop(row_del)
+        if pos > row_del:
+            pos -= 1
+
+        # Suffix start positions after the deletion point shift left.
+        sa = [q if q < position else q - 1 for q in sa]
+
+        self._reorder(sa, bwt, starts, pos, position - 1)
+        self._finish_update(sa, bwt)
+
+    @staticmethod
+    def _reorder(sa: List[int], bwt: List[str], starts: Dict[str, int],
+                 prev_row: int, j: int):
+        """
+        Reorder cascade of the LF-based update: starting from the row of the
+        suffix just after the edit point (`prev_row`), walk suffixes j,
+        j-1, ... leftwards, moving each row to the position LF-mapping says
+        it must occupy, until a suffix is already in place.
+        """
+        while j >= 0:
+            char = bwt[prev_row]  # == text[j], the first character of suffix j.
+            actual = sa.index(j)
+            expected = starts[char] + bwt[:prev_row].count(char)
+            if expected == actual:
+                break  # Everything to the left is already consistent.
+            value = bwt.pop(actual)
+            sa.pop(actual)
+            bwt.insert(expected, value)
+            sa.insert(expected, j)
+            prev_row = expected
+            j -= 1
+
+    def _finish_update(self, sa: List[int], bwt: List[str]):
+        """ Store the edited suffix array / BWT and refresh derived tables. """
+        dtype = np.int32 if len(sa) < 2 ** 31 else np.int64
+        self.suffix_array = np.asarray(sa, dtype=dtype)
+        self._text_arr = self._encode_chars(self.text)
+        self._text_bytes = (self._text_arr.tobytes()
+                            if self._text_arr.dtype == np.uint8 else None)
+        self.bwt = "".join(bwt)
+        self._bwt_arr = self._encode_chars(self.bwt)
+        self.rank_array, self.c_table = self._build_rank_and_c()
+        if self.compact_rank:
+            self._wavelet = WaveletTree(self._bwt_arr)
+        self._c_arr = (np.fromiter(self.c_table.values(), dtype=np.int64)
+                       if self.rank_array is not None else None)
+        self._rank_by_byte, self._c_by_byte = self._build_byte_tables()
+        self._ftab_k = self._pick_ftab_k()
+        self._ftab = self._build_ftab(self._ftab_k) if self._ftab_k else None
+        self._LF = self._build_lf()
+
     def _memory_efficient_search(self, pattern: str) -> List[int]:
         """ Implements binary search on the suffix array to optimize memory usage """
         if not pattern:
             raise ValueError("Search pattern cannot be empty.")
-        
-        # Custom binary search for the left boundary: first index where the suffix is >= pattern.
-        def bisect_left_sa(sa, pattern):
-            lo, hi = 0, len(sa)
-            plen = len(pattern)
+
+        # Compare byte slices where possible: slicing a bytes object and
+        # comparing dispatches to C memcmp instead of building and comparing
+        # fresh Python strings at every probe. Byte order equals character
+        # order for single-byte text; wide text keeps the string path.
+        if self._text_bytes is not None:
+            try:
+                key = pattern.encode('latin-1')
+            except UnicodeEncodeError:
+                # The pattern contains characters the text cannot contain.
+                return [] if self.suffix_array is None else self.suffix_array[:0]
+            text = self._text_bytes
+        else:
+            key, text = pattern, self.text
+
+        # Custom binary search for the left boundary: first row whose suffix is >= pattern.
+        def bisect_left_sa():
+            lo, hi = 0, len(self.bwt)
+            plen = len(key)
 
             while lo < hi:
                 mid = (lo + hi) // 2
-                if self.text[sa[mid]:sa[mid]+plen] < pattern:
+                start = self.locate(mid)
+                if text[start:start+plen] < key:
                     lo = mid + 1
                 else:
                     hi = mid
             return lo
 
-        # Custom binary search for the right boundary: first index where the suffix is > pattern.
-        def bisect_right_sa(sa, pattern):
-            lo, hi = 0, len(sa)
-            plen = len(pattern)
+        # Custom binary search for the right boundary: first row whose suffix is > pattern.
+        def bisect_right_sa():
+            lo, hi = 0, len(self.bwt)
+            plen = len(key)
             while lo < hi:
                 mid = (lo + hi) // 2
-                if self.text[sa[mid]:sa[mid]+plen] <= pattern:
+                start = self.locate(mid)
+                if text[start:start+plen] <= key:
                     lo = mid + 1
                 else:
                     hi = mid
             return lo
 
-        l = bisect_left_sa(self.suffix_array, pattern)
-        r = bisect_right_sa(self.suffix_array, pattern)
+        l = bisect_left_sa()
+        r = bisect_right_sa()
+        if self.suffix_array is None:
+            return [self.locate(i) for i in range(l, r)]
         return self.suffix_array[l:r]
 
 if __name__ == "__main__":